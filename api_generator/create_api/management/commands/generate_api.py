@@ -11,6 +11,38 @@ class Command(BaseCommand):
 
     help = 'Generates API resources for a specified model.'
 
+    # Field type -> (field definition, trailing comment) written into the generated model
+    FIELD_DEFINITIONS = {
+        'CharField': ("models.CharField(max_length=255)", "Character field with max length 255"),
+        'TextField': ("models.TextField()", "Large text field"),
+        'IntegerField': ("models.IntegerField()", "Integer field"),
+        'FloatField': ("models.FloatField()", "Float field"),
+        'BooleanField': ("models.BooleanField(default=False)", "Boolean field"),
+        'DateField': ("models.DateField()", "Date field"),
+        'DateTimeField': ("models.DateTimeField(auto_now_add=True)", "DateTime field"),
+        'EmailField': ("models.EmailField()", "Email field"),
+        'URLField': ("models.URLField()", "URL field"),
+        'DecimalField': ("models.DecimalField(max_digits=10, decimal_places=2)", "Decimal field"),
+        'TimeField': ("models.TimeField()", "Time field"),
+        'DurationField': ("models.DurationField()", "Duration field"),
+        'FileField': ("models.FileField(upload_to='uploads/')", "File upload field"),
+        'ImageField': ("models.ImageField(upload_to='images/')", "Image upload field"),
+        'SlugField': ("models.SlugField()", "Slug field"),
+        'UUIDField': ("models.UUIDField()", "UUID field"),
+        'PositiveIntegerField': ("models.PositiveIntegerField()", "Positive integer field"),
+        'PositiveSmallIntegerField': ("models.PositiveSmallIntegerField()", "Positive small integer field"),
+        'SmallIntegerField': ("models.SmallIntegerField()", "Small integer field"),
+        'BigIntegerField': ("models.BigIntegerField()", "Big integer field"),
+        'JSONField': ("models.JSONField()", "JSON field"),
+    }
+
+    # Relation field types; the definition is completed with the related model entered by the user
+    RELATED_FIELD_DEFINITIONS = {
+        'ForeignKey': ("models.ForeignKey('{related_model}', on_delete=models.CASCADE)", "Foreign key field"),
+        'OneToOneField': ("models.OneToOneField('{related_model}', on_delete=models.CASCADE)", "One-to-one field"),
+        'ManyToManyField': ("models.ManyToManyField('{related_model}')", "Many-to-many field"),
+    }
+
     def add_arguments(self, parser):
         """Add command line arguments for model name and fields."""
         parser.add_argument('--model_name', type=str, help='Name of the model to generate API for')
@@ -27,105 +59,68 @@ class Command(BaseCommand):
             return
 
         # Generate model, serializer, viewset, and URLs dynamically based on the provided fields
-        self.create_model(model_name, fields)
+        # Stop before writing serializers/views/urls for a model that was never generated
+        if not self.create_model(model_name, fields):
+            return
         self.create_serializer(model_name)
         self.create_viewset(model_name)
         self.create_urls(model_name)
 
     def model_exists(self, model_name):
         """Check if the model already exists in the current app."""
-        return model_name in [model.__name__ for model in apps.get_models()]
+        return any(model.__name__ == model_name for model in apps.get_models())
 
     def create_model(self, model_name, fields):
-        """Generate model code based on provided fields."""
+        """Generate model code based on provided fields. Returns True if the model was written."""
         if not model_name.isidentifier():
             self.stdout.write(self.style.ERROR(f"Invalid model name: '{model_name}'. Model names must be valid Python identifiers."))
-            return
+            return False
         
-        model_content = f"""
+        # Collect the model source in pieces and join once before writing
+        model_parts = [f"""
 from django.db import models
 
 class {model_name}(models.Model):
     \"\"\"Model representing {model_name.lower()}\"\"\"
-    """
+    """]
         for field in fields:
             if '=' not in field:
                 self.stdout.write(self.style.ERROR(f"Invalid field format: '{field}'. Expected format is 'name=type'."))
-                return
+                return False
             
             name, field_type = field.split('=')
             
             if not name.isidentifier():
                 self.stdout.write(self.style.ERROR(f"Invalid field name: '{name}'. Field names must be valid Python identifiers."))
-                return
+                return False
             
             # Correctly format the field based on the type
-            if field_type == 'CharField':
-                model_content += f"    {name} = models.CharField(max_length=255)  # Character field with max length 255\n"
-            elif field_type == 'TextField':
-                model_content += f"    {name} = models.TextField()  # Large text field\n"
-            elif field_type == 'IntegerField':
-                model_content += f"    {name} = models.IntegerField()  # Integer field\n"
-            elif field_type == 'FloatField':
-                model_content += f"    {name} = models.FloatField()  # Float field\n"
-            elif field_type == 'BooleanField':
-                model_content += f"    {name} = models.BooleanField(default=False)  # Boolean field\n"
-            elif field_type == 'DateField':
-                model_content += f"    {name} = models.DateField()  # Date field\n"
-            elif field_type == 'DateTimeField':
-                model_content += f"    {name} = models.DateTimeField(auto_now_add=True)  # DateTime field\n"
-            elif field_type == 'EmailField':
-                model_content += f"    {name} = models.EmailField()  # Email field\n"
-            elif field_type == 'URLField':
-                model_content += f"    {name} = models.URLField()  # URL field\n"
-            elif field_type == 'DecimalField':
-                model_content += f"    {name} = models.DecimalField(max_digits=10, decimal_places=2)  # Decimal field\n"
-            elif field_type == 'TimeField':
-                model_content += f"    {name} = models.TimeField()  # Time field\n"
-            elif field_type == 'DurationField':
-                model_content += f"    {name} = models.DurationField()  # Duration field\n"
-            elif field_type == 'FileField':
-                model_content += f"    {name} = models.FileField(upload_to='uploads/')  # File upload field\n"
-            elif field_type == 'ImageField':
-                model_content += f"    {name} = models.ImageField(upload_to='images/')  # Image upload field\n"
-            elif field_type == 'SlugField':
-                model_content += f"    {name} = models.SlugField()  # Slug field\n"
-            elif field_type == 'UUIDField':
-                model_content += f"    {name} = models.UUIDField()  # UUID field\n"
-            elif field_type == 'PositiveIntegerField':
-                model_content += f"    {name} = models.PositiveIntegerField()  # Positive integer field\n"
-            elif field_type == 'PositiveSmallIntegerField':
-                model_content += f"    {name} = models.PositiveSmallIntegerField()  # Positive small integer field\n"
-            elif field_type == 'SmallIntegerField':
-                model_content += f"    {name} = models.SmallIntegerField()  # Small integer field\n"
-            elif field_type == 'BigIntegerField':
-                model_content += f"    {name} = models.BigIntegerField()  # Big integer field\n"
-            elif field_type == 'JSONField':
-                model_content += f"    {name} = models.JSONField()  # JSON field\n"
-            elif field_type == 'ForeignKey':
-                related_model = input(f"Enter the related model for {name}: ")
-                model_content += f"    {name} = models.ForeignKey('{related_model}', on_delete=models.CASCADE)  # Foreign key field\n"
-            elif field_type == 'OneToOneField':
+            if field_type in self.FIELD_DEFINITIONS:
+                definition, comment = self.FIELD_DEFINITIONS[field_type]
+            elif field_type in self.RELATED_FIELD_DEFINITIONS:
                 related_model = input(f"Enter the related model for {name}: ")
-                model_content += f"    {name} = models.OneToOneField('{related_model}', on_delete=models.CASCADE)  # One-to-one field\n"
-            elif field_type == 'ManyToManyField':
-                related_model = input(f"Enter the related model for {name}: ")
-                model_content += f"    {name} = models.ManyToManyField('{related_model}')  # Many-to-many field\n"
+                definition, comment = self.RELATED_FIELD_DEFINITIONS[field_type]
+                definition = definition.format(related_model=related_model)
             else:
                 self.stdout.write(self.style.ERROR(f"Field type '{field_type}' is not recognized."))
-                return
+                return False
+
+            model_parts.append(f"    {name} = {definition}  # {comment}\n")
 
-        model_content += f"""
+        model_parts.append(f"""
     def __str__(self):
         \"\"\"Return a string representation of the model.\"\"\"
         return self.{fields[0].split('=')[0]}  # Return the first field as the string representation
-"""
+""")
+        model_content = "".join(model_parts)
         # Write to models.py with error handling
         try:
             with open('create_api/models.py', 'a') as f:
                 f.write(model_content)
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Failed to write model to file: {e}"))
+            return False
+        return True
 
     def create_serializer(self, model_name):
         """Generate serializer code for the specified model."""
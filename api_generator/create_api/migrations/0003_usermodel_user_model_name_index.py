@@ -0,0 +1,19 @@
+# Generated by Django 5.1.1 on 2026-10-18 00:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('create_api', '0002_usermodel_full_code'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usermodel',
+            index=models.Index(fields=['user', 'model_name'], name='create_api__user_id_b16596_idx'),
+        ),
+    ]
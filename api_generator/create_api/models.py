@@ -14,5 +14,12 @@ class UserModel(models.Model):
     visibility = models.CharField(max_length=10, choices=VISIBILITY_CHOICES, default='private')
     created_at = models.DateTimeField(auto_now_add=True)
     full_code = models.TextField(null=True)
+
+    class Meta:
+        # Serves the per-user duplicate model name check on create
+        indexes = [
+            models.Index(fields=['user', 'model_name']),
+        ]
+
     def __str__(self):
         return self.model_name
@@ -1,8 +1,11 @@
+import logging
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from .models import UserModel
 from .utils import parse_code_with_comments, generate_code_from_json
 
+logger = logging.getLogger(__name__)
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -54,7 +57,7 @@ class UserModelSerializer(serializers.ModelSerializer):
         if code:
             parsed_json = parse_code_with_comments(code)
             validated_data['fields'] = parsed_json['fields']  # Should include comments
-        print("Validated data in update:", validated_data) 
+        logger.debug("Validated data in update: %s", validated_data)
         instance.model_name = validated_data.get('model_name', instance.model_name)
         instance.visibility = validated_data.get('visibility', instance.visibility)
         instance.fields = validated_data.get('fields', instance.fields)
@@ -1,5 +1,9 @@
 import re
 
+FIELD_DEFINITION_RE = re.compile(r'(\w+)\s*=\s*models\.(\w+Field)\((.*)\)')
+PARAMETER_SPLIT_RE = re.compile(r',\s*(?=(?:[^"]*"[^"]*")*[^"]*$)')
+PARAMETER_RE = re.compile(r'(\w+)\s*=\s*"(.*?)"')
+
 def parse_code_with_comments(code):
     json_data = {
         "fields": []
@@ -8,33 +12,33 @@ def parse_code_with_comments(code):
     lines = code.splitlines()
     field = None
     inside_multiline_comment = False
-    multiline_comment = ""
+    multiline_comment_lines = []
 
     for line in lines:
         # Handle multiline comments
         if '"""' in line:
             if inside_multiline_comment:
-                multiline_comment += f"\n{line.strip()}"
+                multiline_comment_lines.append(line.strip())
                 if field:
                     field["comments"].append({
                         "type": "multiline",
-                        "text": multiline_comment.strip(),
+                        "text": "\n".join(multiline_comment_lines).strip(),
                         "position": "after"
                     })
-                multiline_comment = ""
+                multiline_comment_lines = []
                 inside_multiline_comment = False
             else:
-                multiline_comment = line.strip()
+                multiline_comment_lines = [line.strip()]
                 inside_multiline_comment = True
             continue
 
         if inside_multiline_comment:
-            multiline_comment += f"\n{line.strip()}"
+            multiline_comment_lines.append(line.strip())
             continue
 
         # Match field definitions
-        field_match = re.match(r'(\w+)\s*=\s*models\.(\w+Field)\((.*)\)', line)
-        inline_comment_match = re.search(r'#(.*)', line)
+        field_match = FIELD_DEFINITION_RE.match(line)
+        inline_comment_start = line.find('#')
         
         if field_match:
             field_name, field_type, parameters = field_match.groups()
@@ -47,8 +51,8 @@ def parse_code_with_comments(code):
             json_data["fields"].append(field)
 
         # Handle inline comment if there's an ongoing field
-        if inline_comment_match and field:
-            comment_text = inline_comment_match.group(1).strip()
+        if inline_comment_start != -1 and field:
+            comment_text = line[inline_comment_start + 1:].strip()
             field["comments"].append({
                 "type": "inline",
                 "text": f"#{comment_text}",
@@ -62,10 +66,10 @@ def parse_parameters(parameter_string):
     if not parameter_string:
         return parameters
 
-    params = re.split(r',\s*(?=(?:[^"]*"[^"]*")*[^"]*$)', parameter_string)
+    params = PARAMETER_SPLIT_RE.split(parameter_string)
     
     for param in params:
-        match = re.match(r'(\w+)\s*=\s*"(.*?)"', param)
+        match = PARAMETER_RE.match(param)
         if match:
             key, value = match.groups()
             parameters[key] = value
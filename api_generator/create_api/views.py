@@ -133,7 +133,7 @@ class UserModelViewSet(viewsets.ModelViewSet):
         try:
                 serializer.save(user=self.request.user)  # Set the user automatically
         except ValidationError as e:
-            print("Validation error:", e.detail)
+            logger.debug("Validation error: %s", e.detail)
             raise
     def update(self, request, *args, **kwargs):
         instance = self.get_object()